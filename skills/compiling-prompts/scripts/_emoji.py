@@ -0,0 +1,153 @@
+"""
+Shared emoji helpers for the CherryStudio prompt scripts.
+
+Holds the keyword-to-emoji table used to pick an emoji from a prompt's
+description, and the Unicode ranges used to decide whether a string looks
+like an emoji. compile.py and fix.py both import from here so the two tools
+always choose the same emoji.
+
+Requirements:
+    - Python 3.6+ (standard library only, no external dependencies)
+"""
+
+import re
+from functools import lru_cache
+from typing import List, Tuple
+
+
+# Emoji mapping based on semantic patterns
+EMOJI_PATTERNS = {
+    # Business & Product
+    r"(product\s*manager|pm|business|strategy|roadmap|pric(?:ing|e)|market(?:ing)?)": "👨‍💼",
+    r"(startup|founder|entrepreneur|ceo|cto|leadership)": "🚀",
+
+    # Development
+    r"(developer|engineer|coding|programming|software|debug(?:ging)?|code)": "👨‍💻",
+    r"(frontend|backend|full[-\s]?stack|devops|api|rest|graphql)": "💻",
+    r"(python|javascript|typescript|java|golang|rust|cpp|c\+\+)": "🐍",
+
+    # Design & Creative
+    r"(design(?:er)?|creative|art|ui|ux|figma|sketch|visual)": "🎨",
+    r"(writer|writing|copy(?:writing)?|content|blog|article)": "✍️",
+    r"(video|photo|image|media|editing|film)": "🎬",
+
+    # Analytics & Data
+    r"(analytic|data|metric|statistics|insight|report|dashboard)": "📊",
+    r"(sql|database|query|etl|pipeline|warehouse)": "🗄️",
+    r"(machine\s*learning|ml|ai|artificial\s*intelligence|model|training)": "🤖",
+
+    # Communication
+    r"(chat|support|communication|customer|service|help(?!er))": "💬",
+    r"(email|newsletter|marketing|outreach|campaign)": "📧",
+
+    # Education
+    r"(teacher|education|learning|tutorial|course|mentor|coach)": "📚",
+    r"(student|academic|paper|thesis|study)": "🎓",
+
+    # Finance
+    r"(finance|money|trading|investment|crypto|bitcoin|stock)": "💰",
+    r"(accounting|budget|invoice|payment)": "💵",
+
+    # Science & Research
+    r"(science|research|lab|experiment|discovery|biology|chemistry)": "🔬",
+    r"(math|physics|calculation|formula|equation)": "🧮",
+
+    # Tools & Utilities
+    r"(assistant|helper|copilot|aid|tool|utility)": "🤖",
+    r"(automation|workflow|script|batch|process)": "⚙️",
+    r"(security|privacy|encrypt|protect|auth)": "🔒",
+
+    # Documents & Files
+    r"(document|pdf|word|excel|spreadsheet|presentation)": "📄",
+    r"(file|folder|directory|storage|backup|sync)": "📁",
+
+    # Web & Internet
+    r"(web|website|html|css|browser|internet|url|link)": "🌐",
+    r"(seo|search|google|index|ranking)": "🔍",
+
+    # General / Default
+    r"(general|default|universal|common)": "🔧",
+}
+
+# Default emoji fallback
+DEFAULT_EMOJI = "🔧"
+
+# All patterns fused into one regex, one named group per pattern (g0, g1, ...).
+# The alternation sits inside a zero-width lookahead so every position is
+# tried without consuming text; the lowest group index found is the first
+# pattern in EMOJI_PATTERNS order that matches, same as testing them one by one.
+# Matches must start at a word boundary ("pm" must not hit "development").
+_FUSED_EMOJI_RE = re.compile(
+    "(?=" + "|".join(f"\\b(?P<g{i}>{pattern})" for i, pattern in enumerate(EMOJI_PATTERNS)) + ")",
+    re.IGNORECASE,
+)
+_FUSED_EMOJIS = tuple(EMOJI_PATTERNS.values())
+
+
+def classify(text: str) -> str:
+    """Pick an emoji for text from EMOJI_PATTERNS (DEFAULT_EMOJI if nothing matches)."""
+    best = None
+    for match in _FUSED_EMOJI_RE.finditer(text):
+        index = int(match.lastgroup[1:])
+        if best is None or index < best:
+            best = index
+            if best == 0:
+                break
+
+    return _FUSED_EMOJIS[best] if best is not None else DEFAULT_EMOJI
+
+
+# Unicode blocks treated as emoji (some overlap)
+EMOJI_RANGES = [
+    (0x1F600, 0x1F64F),  # Emoticons
+    (0x1F300, 0x1F5FF),  # Misc Symbols and Pictographs
+    (0x1F680, 0x1F6FF),  # Transport and Map
+    (0x1F1E0, 0x1F1FF),  # Flags
+    (0x2600, 0x26FF),    # Misc symbols
+    (0x2700, 0x27BF),    # Dingbats
+    (0x1F900, 0x1F9FF),  # Supplemental Symbols and Pictographs
+    (0x1FA00, 0x1FA6F),  # Chess Symbols
+    (0x1FA70, 0x1FAFF),  # Symbols and Pictographs Extended-A
+    (0x231A, 0x23FF),    # Miscellaneous Technical
+    (0x2B50, 0x2B55),    # Stars
+    (0x203C, 0x3299),    # Miscellaneous Symbols
+]
+
+
+def _build_bitmap(ranges: List[Tuple[int, int]]) -> bytes:
+    """Bitmap with bit (code & 7) of byte (code >> 3) set for each code point in ranges."""
+    bitmap = bytearray((max(end for _, end in ranges) >> 3) + 1)
+    for start, end in ranges:
+        for code in range(start, end + 1):
+            bitmap[code >> 3] |= 1 << (code & 7)
+    return bytes(bitmap)
+
+
+# One bit per code point up to the end of the last range (~16 KB)
+_EMOJI_BITMAP = _build_bitmap(EMOJI_RANGES)
+_EMOJI_BITMAP_LIMIT = len(_EMOJI_BITMAP) << 3
+
+
+# Every emoji range starts at or above this character
+_EMOJI_MIN_CHAR = chr(min(start for start, _ in EMOJI_RANGES))
+
+
+def contains_emoji(text: str) -> bool:
+    """Check if any character of text is in EMOJI_RANGES."""
+    # Fast path: plain text (ASCII, Latin, Greek, Cyrillic...) sorts entirely
+    # below the first emoji range; max() checks that in one C-level pass
+    if not text or max(text) < _EMOJI_MIN_CHAR:
+        return False
+    return _scan_for_emoji(text)
+
+
+@lru_cache(maxsize=1024)
+def _scan_for_emoji(text: str) -> bool:
+    """Look up each character of text in the bitmap (cached; emojis repeat a lot)."""
+    bitmap = _EMOJI_BITMAP
+    limit = _EMOJI_BITMAP_LIMIT
+    for char in text:
+        code = ord(char)
+        if code < limit and bitmap[code >> 3] & (1 << (code & 7)):
+            return True
+    return False
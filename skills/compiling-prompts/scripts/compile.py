@@ -11,6 +11,7 @@ Usage:
 
 Requirements:
     - Python 3.6+ (standard library only, no external dependencies)
+    - Optional: orjson, used for faster JSON writing when installed
 """
 
 import argparse
@@ -18,99 +19,61 @@ import json
 import os
 import re
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Dict, Iterator, List, Optional, Tuple
 
+try:
+    import orjson  # Optional: faster JSON encoding/decoding
+except ImportError:
+    orjson = None
 
-# Emoji mapping based on semantic patterns
-EMOJI_PATTERNS = {
-    # Business & Product
-    r"(product\s*manager|pm|business|strategy|roadmap|pric(?:ing|e)|market(?:ing)?)": "👨‍💼",
-    r"(startup|founder|entrepreneur|ceo|cto|leadership)": "🚀",
+from _emoji import classify
 
-    # Development
-    r"(developer|engineer|coding|programming|software|debug(?:ging)?|code)": "👨‍💻",
-    r"(frontend|backend|full[-\s]?stack|devops|api|rest|graphql)": "💻",
-    r"(python|javascript|typescript|java|golang|rust|cpp|c\+\+)": "🐍",
 
-    # Design & Creative
-    r"(design(?:er)?|creative|art|ui|ux|figma|sketch|visual)": "🎨",
-    r"(writer|writing|copy(?:writing)?|content|blog|article)": "✍️",
-    r"(video|photo|image|media|editing|film)": "🎬",
+# Default group for prompts without a category
+DEFAULT_GROUP = "General"
 
-    # Analytics & Data
-    r"(analytic|data|metric|statistics|insight|report|dashboard)": "📊",
-    r"(sql|database|query|etl|pipeline|warehouse)": "🗄️",
-    r"(machine\s*learning|ml|ai|artificial\s*intelligence|model|training)": "🤖",
+_FRONTMATTER_RE = re.compile(r"^---\s*\n(.*?)\n---\s*\n(.*)$", re.DOTALL)
 
-    # Communication
-    r"(chat|support|communication|customer|service|help)": "💬",
-    r"(email|newsletter|marketing|outreach|campaign)": "📧",
 
-    # Education
-    r"(teacher|education|learning|tutorial|course|mentor|coach)": "📚",
-    r"(student|academic|research|paper|thesis|study)": "🎓",
-
-    # Finance
-    r"(finance|money|trading|investment|crypto|bitcoin|stock)": "💰",
-    r"(accounting|budget|invoice|payment)": "💵",
-
-    # Science & Research
-    r"(science|research|lab|experiment|discovery|biology|chemistry)": "🔬",
-    r"(math|physics|calculation|formula|equation)": "🧮",
-
-    # Tools & Utilities
-    r"(assistant|helper|copilot|aid|tool|utility)": "🤖",
-    r"(automation|workflow|script|batch|process)": "⚙️",
-    r"(security|privacy|encrypt|protect|auth)": "🔒",
-
-    # Documents & Files
-    r"(document|pdf|word|excel|spreadsheet|presentation)": "📄",
-    r"(file|folder|directory|storage|backup|sync)": "📁",
-
-    # Web & Internet
-    r"(web|website|html|css|browser|internet|url|link)": "🌐",
-    r"(seo|search|google|index|ranking)": "🔍",
-
-    # General / Default
-    r"(general|default|universal|common)": "🔧",
+# ANSI color codes
+ANSI_COLORS = {
+    "red": "\033[91m",
+    "green": "\033[92m",
+    "yellow": "\033[93m",
+    "blue": "\033[94m",
+    "magenta": "\033[95m",
+    "cyan": "\033[96m",
+    "white": "\033[97m",
+    "bold": "\033[1m",
+    "reset": "\033[0m",
 }
+ANSI_RESET = ANSI_COLORS["reset"]
 
-# Default emoji fallback
-DEFAULT_EMOJI = "🔧"
+_ansi_enabled: Optional[bool] = None
 
 
 def enable_ansi_colors() -> bool:
-    """Enable ANSI colors on Windows."""
+    """Enable ANSI colors on Windows (only does the work on the first call)."""
+    global _ansi_enabled
+    if _ansi_enabled is not None:
+        return _ansi_enabled
+
+    _ansi_enabled = True
     if sys.platform == "win32":
         try:
             import ctypes
             kernel32 = ctypes.windll.kernel32
             kernel32.SetConsoleMode(kernel32.GetStdHandle(-11), 7)
-            return True
         except Exception:
-            return False
-    return True
+            _ansi_enabled = False
+    return _ansi_enabled
 
 
 def print_color(text: str, color: str = "") -> None:
     """Print colored text to terminal (works on Windows, Mac, Linux)."""
-    # ANSI color codes
-    colors = {
-        "red": "\033[91m",
-        "green": "\033[92m",
-        "yellow": "\033[93m",
-        "blue": "\033[94m",
-        "magenta": "\033[95m",
-        "cyan": "\033[96m",
-        "white": "\033[97m",
-        "bold": "\033[1m",
-        "reset": "\033[0m",
-    }
-
-    color_code = colors.get(color, "")
-    reset_code = colors["reset"]
-    print(f"{color_code}{text}{reset_code}")
+    print(f"{ANSI_COLORS.get(color, '')}{text}{ANSI_RESET}")
 
 
 def print_header(text: str) -> None:
@@ -121,6 +84,22 @@ def print_header(text: str) -> None:
     print("=" * 50)
 
 
+def dump_json_bytes(data: Any) -> bytes:
+    """
+    Serialize data as 2-space indented UTF-8 JSON.
+
+    orjson is used when available. It rejects integers beyond 64 bits (e.g.
+    a long numeric frontmatter value), so those fall back to the stdlib
+    encoder.
+    """
+    if orjson is not None:
+        try:
+            return orjson.dumps(data, option=orjson.OPT_INDENT_2)
+        except orjson.JSONEncodeError:
+            pass
+    return json.dumps(data, ensure_ascii=False, indent=2).encode("utf-8")
+
+
 def parse_yaml_frontmatter(content: str) -> Tuple[Dict[str, Any], str]:
     """
     Extract YAML frontmatter from Markdown content.
@@ -129,20 +108,32 @@ def parse_yaml_frontmatter(content: str) -> Tuple[Dict[str, Any], str]:
     Returns:
         Tuple of (frontmatter_dict, full_content_with_frontmatter)
     """
-    frontmatter_match = re.match(r"^---\s*\n(.*?)\n---\s*\n(.*)$", content, re.DOTALL)
+    frontmatter_match = _FRONTMATTER_RE.match(content)
 
     if not frontmatter_match:
         return {}, content
 
     yaml_text = frontmatter_match.group(1)
-    body = frontmatter_match.group(2)
 
     try:
         frontmatter = simple_yaml_parse(yaml_text)
-        return frontmatter, f"---\n{yaml_text}\n---\n\n{body}".strip()
     except Exception:
         return {}, content
 
+    # Content already laid out as "---\n<yaml>\n---\n\n<body>": reuse it
+    # rather than rebuilding an identical copy
+    yaml_end = frontmatter_match.end(1)
+    if (
+        frontmatter_match.start(1) == 4
+        and content.startswith("---\n")
+        and content.startswith("\n---\n\n", yaml_end)
+        and frontmatter_match.start(2) == yaml_end + 6
+    ):
+        return frontmatter, content.rstrip()
+
+    body = frontmatter_match.group(2)
+    return frontmatter, f"---\n{yaml_text}\n---\n\n{body}".strip()
+
 
 def simple_yaml_parse(text: str) -> Dict[str, Any]:
     """
@@ -150,111 +141,107 @@ def simple_yaml_parse(text: str) -> Dict[str, Any]:
     Handles key-value pairs, lists, and basic nested structures.
 
     This is a basic implementation that covers common frontmatter cases
-    without requiring the pyyaml library.
+    without requiring the pyyaml library. Lines are read in a single pass;
+    a top-level key followed by "- item" lines becomes a list.
     """
     result: Dict[str, Any] = {}
-    lines = text.split("\n")
+    current_key: Optional[str] = None
+    current_list: Optional[List[str]] = None
+    # Top-level keys whose value came from the lines below them (a list or
+    # an indented "key: value"); these take precedence over inline values
+    block_keys = set()
 
-    for line in lines:
+    for line in text.splitlines():
         # Skip empty lines and comments
         stripped = line.strip()
         if not stripped or stripped.startswith("#"):
             continue
 
-        # Check for key-value pair
-        if ":" in line:
-            key, value = line.split(":", 1)
-            key = key.strip()
-            value = value.strip()
-
-            if not value:
-                # Empty value, skip
+        if stripped.startswith("- "):
+            # List item belonging to the current top-level key
+            if current_key is None or (current_key in block_keys and current_list is None):
                 continue
-            elif value.startswith('"') and value.endswith('"'):
-                # Quoted string
-                result[key] = value[1:-1]
-            elif value.startswith("'") and value.endswith("'"):
-                # Single quoted string
-                result[key] = value[1:-1]
-            elif value.lower() == "true":
-                result[key] = True
-            elif value.lower() == "false":
-                result[key] = False
-            elif value.isdigit():
-                result[key] = int(value)
-            else:
-                # String value (may have trailing comment)
-                if "#" in value:
-                    value = value.split("#")[0].strip()
-                result[key] = value
-
-        # Check for list item (indented with -)
-        elif stripped.startswith("- ") and "|" not in stripped:
-            # Find the key this list belongs to
-            # Look at previous line to determine the key
-            value = stripped[2:].strip().strip('"').strip("'")
-            # For simple frontmatter, we'll just skip list items
-            # as they're less common for basic use cases
-            pass
+            value = _unquote(stripped[2:])
+            if current_list is None:
+                current_list = []
+                result[current_key] = current_list
+                block_keys.add(current_key)
+            current_list.append(value)
+            continue
 
-    # Handle multi-line lists (categories, tags)
-    # Parse lines starting with "- " that follow certain keys
-    current_key = None
-    result_with_lists: Dict[str, Any] = {}
+        key, sep, value = line.partition(":")
+        if not sep:
+            continue
 
-    for line in lines:
-        stripped = line.strip()
+        key = key.strip()
+        value = value.strip()
 
-        if ":" in line and not line.startswith(" "):
-            # Top-level key
-            key = line.split(":", 1)[0].strip()
+        if not line.startswith(" "):
+            # Top-level key starts a new block
             current_key = key
-            result_with_lists[key] = None
-        elif current_key and stripped.startswith("- "):
-            # List item
-            value = stripped[2:].strip().strip('"').strip("'")
-            if result_with_lists[current_key] is None:
-                result_with_lists[current_key] = [value]
-            else:
-                if isinstance(result_with_lists[current_key], list):
-                    result_with_lists[current_key].append(value)
-        elif current_key and result_with_lists[current_key] is None:
-            # Single value for key
-            if ":" in line:
-                value = line.split(":", 1)[1].strip().strip('"').strip("'")
-                result_with_lists[current_key] = value
-
-    # Merge results, preferring the list-aware version
-    for key, value in result_with_lists.items():
-        if value is not None:
-            result[key] = value
+            current_list = None
+            block_keys.discard(key)
+        elif current_key is not None and current_key not in block_keys:
+            # Indented value directly under a top-level key
+            result[current_key] = _unquote(value)
+            block_keys.add(current_key)
+
+        if value and key not in block_keys:
+            result[key] = _parse_scalar(value)
 
     return result
 
 
-def generate_emoji(description: str, filename: str) -> str:
-    """Generate emoji based on semantic understanding of description."""
-    text_to_analyze = (description or "" + " " + filename).lower()
+def _unquote(value: str) -> str:
+    """Strip surrounding whitespace and one pair of matching quotes."""
+    value = value.strip()
+    if len(value) >= 2 and value[0] == value[-1] and value[0] in "\"'":
+        return value[1:-1]
+    return value
+
+
+def _parse_scalar(value: str) -> Any:
+    """Convert a non-empty YAML scalar to str, bool or int."""
+    if value.startswith('"') and value.endswith('"'):
+        # Quoted string
+        return value[1:-1]
+    if value.startswith("'") and value.endswith("'"):
+        # Single quoted string
+        return value[1:-1]
+    if value.lower() == "true":
+        return True
+    if value.lower() == "false":
+        return False
+    if value.isdigit():
+        return int(value)
+    # String value (may have trailing comment)
+    if "#" in value:
+        value = value.partition("#")[0].strip()
+    return value
 
-    for pattern, emoji in EMOJI_PATTERNS.items():
-        if re.search(pattern, text_to_analyze):
-            return emoji
 
-    return DEFAULT_EMOJI
+def generate_emoji(description: str, filename: str) -> str:
+    """Generate emoji based on semantic understanding of description."""
+    return classify(f"{description or ''} {filename}")
 
 
 def normalize_category(category: Any) -> List[str]:
-    """Normalize category to array format."""
+    """
+    Normalize category to array format.
+
+    Category names are interned: catalogs repeat a handful of them across
+    many files, so each distinct name is stored once.
+    """
     if category is None:
-        return ["General"]
+        return [DEFAULT_GROUP]
 
     if isinstance(category, str):
-        return [category]
+        return [sys.intern(category)]
 
     if isinstance(category, list):
-        return [str(c) for c in category if c]
+        return [sys.intern(str(c)) for c in category if c]
 
-    return ["General"]
+    return [DEFAULT_GROUP]
 
 
 def compile_file(file_path: Path, errors: List[str], warnings: List[str]) -> Optional[Dict[str, Any]]:
@@ -265,11 +252,16 @@ def compile_file(file_path: Path, errors: List[str], warnings: List[str]) -> Opt
         Dictionary with compiled prompt data, or None if compilation failed.
     """
     try:
-        content = file_path.read_text(encoding="utf-8")
+        with open(file_path, "rb") as f:
+            content = f.read().decode("utf-8")
     except Exception as e:
         errors.append(f"Failed to read {file_path.name}: {e}")
         return None
 
+    # Match text-mode reading: normalize Windows/old Mac line endings
+    if "\r" in content:
+        content = content.replace("\r\n", "\n").replace("\r", "\n")
+
     frontmatter, full_content = parse_yaml_frontmatter(content)
 
     # Extract fields with defaults
@@ -290,15 +282,45 @@ def compile_file(file_path: Path, errors: List[str], warnings: List[str]) -> Opt
     }
 
 
-def compile_directory(input_dir: Path, recursive: bool = True) -> Tuple[List[Dict[str, Any]], List[str], List[str]]:
+def _iter_markdown_files(root: Path, recursive: bool = True) -> Iterator[str]:
+    """Yield paths of *.md files under root using os.scandir (no extra stat calls)."""
+    pending = [str(root)]
+    while pending:
+        try:
+            entries = os.scandir(pending.pop())
+        except OSError:
+            # Unreadable directories are skipped, as Path.glob did
+            continue
+        with entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    if recursive:
+                        pending.append(entry.path)
+                elif entry.name.endswith(".md") and entry.is_file():
+                    yield entry.path
+
+
+def _compile_file_isolated(file_path: Path) -> Tuple[Optional[Dict[str, Any]], List[str], List[str]]:
+    """Compile one file with its own error/warning lists (safe to run in a worker thread)."""
+    errors: List[str] = []
+    warnings: List[str] = []
+    prompt = compile_file(file_path, errors, warnings)
+    return prompt, errors, warnings
+
+
+def compile_directory(
+    input_dir: Path, recursive: bool = True, max_workers: Optional[int] = None
+) -> Tuple[List[Dict[str, Any]], List[str], List[str]]:
     """
     Compile all Markdown files in a directory.
 
+    Files are read and parsed concurrently in a thread pool; results are
+    collected in sorted file order, so output and IDs are deterministic.
+
     Returns:
         Tuple of (compiled_prompts, errors, warnings)
     """
-    pattern = "**/*.md" if recursive else "*.md"
-    md_files = sorted(input_dir.glob(pattern))
+    md_files = sorted(Path(path) for path in _iter_markdown_files(input_dir, recursive))
 
     if not md_files:
         return [], [], []
@@ -309,18 +331,19 @@ def compile_directory(input_dir: Path, recursive: bool = True) -> Tuple[List[Dic
 
     print(f"\nCompiling {len(md_files)} prompt(s)...\n")
 
-    for i, md_file in enumerate(md_files, 1):
-        if not md_file.is_file():
-            continue
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        results = executor.map(_compile_file_isolated, md_files)
 
-        print(f"[{i}/{len(md_files)}] {md_file.name}...", end=" ")
+        for i, (md_file, (prompt, file_errors, file_warnings)) in enumerate(zip(md_files, results), 1):
+            print(f"[{i}/{len(md_files)}] {md_file.name}...", end=" ")
 
-        prompt = compile_file(md_file, errors, warnings)
-        if prompt:
-            compiled_prompts.append(prompt)
-            print_color("OK", "green")
-        else:
-            print_color("FAILED", "red")
+            errors.extend(file_errors)
+            warnings.extend(file_warnings)
+            if prompt:
+                compiled_prompts.append(prompt)
+                print_color("OK", "green")
+            else:
+                print_color("FAILED", "red")
 
     # Assign sequential IDs
     for idx, prompt in enumerate(compiled_prompts, 1):
@@ -378,7 +401,7 @@ Examples:
         sys.exit(1)
 
     # Write output
-    output_file.write_text(json.dumps(prompts, ensure_ascii=False, indent=2), encoding="utf-8")
+    output_file.write_bytes(dump_json_bytes(prompts))
 
     # Print summary
     print_header("Compilation Summary")
@@ -12,46 +12,62 @@ Usage:
 
 Requirements:
     - Python 3.6+ (standard library only, no external dependencies)
+    - Optional: orjson, used for faster JSON writing when installed
 """
 
 import argparse
 import json
 import re
 import sys
+from functools import lru_cache
 from pathlib import Path
 from typing import Any, Dict, List, Optional
 
+try:
+    import orjson  # Optional: faster JSON encoding/decoding
+except ImportError:
+    orjson = None
+
+from _emoji import classify, contains_emoji
+
+
+# ANSI color codes
+ANSI_COLORS = {
+    "red": "\033[91m",
+    "green": "\033[92m",
+    "yellow": "\033[93m",
+    "blue": "\033[94m",
+    "magenta": "\033[95m",
+    "cyan": "\033[96m",
+    "white": "\033[97m",
+    "bold": "\033[1m",
+    "reset": "\033[0m",
+}
+ANSI_RESET = ANSI_COLORS["reset"]
+
+_ansi_enabled: Optional[bool] = None
+
 
 def enable_ansi_colors() -> bool:
-    """Enable ANSI colors on Windows."""
+    """Enable ANSI colors on Windows (only does the work on the first call)."""
+    global _ansi_enabled
+    if _ansi_enabled is not None:
+        return _ansi_enabled
+
+    _ansi_enabled = True
     if sys.platform == "win32":
         try:
             import ctypes
             kernel32 = ctypes.windll.kernel32
             kernel32.SetConsoleMode(kernel32.GetStdHandle(-11), 7)
-            return True
         except Exception:
-            return False
-    return True
+            _ansi_enabled = False
+    return _ansi_enabled
 
 
 def print_color(text: str, color: str = "") -> None:
     """Print colored text to terminal (works on Windows, Mac, Linux)."""
-    colors = {
-        "red": "\033[91m",
-        "green": "\033[92m",
-        "yellow": "\033[93m",
-        "blue": "\033[94m",
-        "magenta": "\033[95m",
-        "cyan": "\033[96m",
-        "white": "\033[97m",
-        "bold": "\033[1m",
-        "reset": "\033[0m",
-    }
-
-    color_code = colors.get(color, "")
-    reset_code = colors["reset"]
-    print(f"{color_code}{text}{reset_code}")
+    print(f"{ANSI_COLORS.get(color, '')}{text}{ANSI_RESET}")
 
 
 def print_header(text: str) -> None:
@@ -62,72 +78,51 @@ def print_header(text: str) -> None:
     print("=" * 50)
 
 
-# Emoji mapping for fixing missing/invalid emojis
-EMOJI_FIXES = {
-    # Business & Product
-    "product manager": "👨‍💼",
-    "pm": "👨‍💼",
-    "business": "👨‍💼",
-    "strategy": "👨‍💼",
-    "marketing": "👨‍💼",
-    "startup": "🚀",
-    "founder": "🚀",
-
-    # Development
-    "developer": "👨‍💻",
-    "engineer": "👨‍💻",
-    "coding": "👨‍💻",
-    "programming": "👨‍💻",
-    "software": "👨‍💻",
-    "debug": "👨‍💻",
-    "frontend": "💻",
-    "backend": "💻",
-    "devops": "💻",
-
-    # Design & Creative
-    "design": "🎨",
-    "creative": "🎨",
-    "ui": "🎨",
-    "ux": "🎨",
-    "writer": "✍️",
-    "writing": "✍️",
-    "content": "✍️",
-
-    # Analytics & Data
-    "analytic": "📊",
-    "data": "📊",
-    "metric": "📊",
-    "statistics": "📊",
-
-    # Communication
-    "chat": "💬",
-    "support": "💬",
-    "communication": "💬",
-    "customer": "💬",
-
-    # Education
-    "teacher": "📚",
-    "education": "📚",
-    "learning": "📚",
-    "tutorial": "📚",
-
-    # Finance
-    "finance": "💰",
-    "money": "💰",
-    "trading": "💰",
-
-    # Science & Research
-    "science": "🔬",
-    "research": "🔬",
-
-    # Tools & Utilities
-    "assistant": "🤖",
-    "helper": "🤖",
-    "copilot": "🤖",
-    "automation": "⚙️",
-}
+def dump_json_bytes(data: Any, use_orjson: bool = True) -> bytes:
+    """
+    Serialize data as 2-space indented UTF-8 JSON.
+
+    orjson is used when available and use_orjson is set. It rejects
+    integers beyond 64 bits, so those fall back to the stdlib encoder.
+    """
+    if orjson is not None and use_orjson:
+        try:
+            return orjson.dumps(data, option=orjson.OPT_INDENT_2)
+        except orjson.JSONEncodeError:
+            pass
+    return json.dumps(data, ensure_ascii=False, indent=2).encode("utf-8")
+
 
-DEFAULT_EMOJI = "🔧"
+def load_json_bytes(data: bytes) -> Any:
+    """
+    Parse UTF-8 JSON bytes.
+
+    Always the stdlib parser: fix.py rewrites files in place, and orjson
+    would turn big integers into floats and reject NaN/Infinity.
+    """
+    return json.loads(data)
+
+
+DEFAULT_GROUP = "General"
+
+# Titles live at the top of a prompt; don't scan whole bodies for one
+_TITLE_SCAN_LINES = 50
+_KEBAB_RE = re.compile(r"[\s_]+")
+
+
+MINIMAL_FRONTMATTER_TEMPLATE = (
+    "---\n"
+    "description: {description}\n"
+    "category:\n"
+    "  - {category}\n"
+    "---"
+)
+
+
+@lru_cache(maxsize=256)
+def _minimal_frontmatter(description: str, category: str) -> str:
+    """Render MINIMAL_FRONTMATTER_TEMPLATE (cached; many prompts share defaults)."""
+    return MINIMAL_FRONTMATTER_TEMPLATE.format(description=description, category=category)
 
 
 class FixResult:
@@ -181,7 +176,7 @@ class PromptFixer:
 
         return False
 
-    def fix_name(self, prompt: Dict[str, Any]) -> bool:
+    def fix_name(self, prompt: Dict[str, Any], pid: Optional[str] = None) -> bool:
         """
         Fix name field - ensure non-empty string.
 
@@ -189,7 +184,8 @@ class PromptFixer:
             True if a fix was applied.
         """
         name = prompt.get("name", "")
-        pid = prompt.get("id", "unknown")
+        if pid is None:
+            pid = prompt.get("id", "unknown")
 
         if not name or not isinstance(name, str):
             # Try to extract name from prompt content
@@ -208,16 +204,16 @@ class PromptFixer:
 
     def _extract_name_from_content(self, content: str) -> Optional[str]:
         """Try to extract a meaningful name from prompt content."""
-        # Look for title pattern (# Title)
-        title_match = re.search(r"^#\s+(.+)$", content, re.MULTILINE)
-        if title_match:
-            # Convert to kebab-case
-            title = title_match.group(1).strip()
-            return re.sub(r"[\s_]+", "-", title.lower()).strip()
+        # Look for title pattern (# Title) in the first lines
+        for line in content.split("\n", _TITLE_SCAN_LINES)[:_TITLE_SCAN_LINES]:
+            if len(line) > 2 and line[0] == "#" and line[1].isspace():
+                # Convert to kebab-case
+                title = line[1:].strip()
+                return _KEBAB_RE.sub("-", title.lower()).strip()
 
         return None
 
-    def fix_emoji(self, prompt: Dict[str, Any]) -> bool:
+    def fix_emoji(self, prompt: Dict[str, Any], pid: Optional[str] = None) -> bool:
         """
         Fix emoji field - ensure valid emoji based on semantic analysis.
 
@@ -225,7 +221,8 @@ class PromptFixer:
             True if a fix was applied.
         """
         emoji = prompt.get("emoji", "")
-        pid = prompt.get("id", "unknown")
+        if pid is None:
+            pid = prompt.get("id", "unknown")
         description = prompt.get("description", "")
         name = prompt.get("name", "")
 
@@ -241,42 +238,16 @@ class PromptFixer:
 
     def _is_valid_emoji(self, text: str) -> bool:
         """Check if text contains a valid emoji."""
-        if not text or len(text) > 4:
+        if not isinstance(text, str) or not text or len(text) > 4:
             return False
 
-        emoji_ranges = [
-            (0x1F600, 0x1F64F),  # Emoticons
-            (0x1F300, 0x1F5FF),  # Misc Symbols and Pictographs
-            (0x1F680, 0x1F6FF),  # Transport and Map
-            (0x1F1E0, 0x1F1FF),  # Flags
-            (0x2600, 0x26FF),    # Misc symbols
-            (0x2700, 0x27BF),    # Dingbats
-            (0x1F900, 0x1F9FF),  # Supplemental Symbols and Pictographs
-            (0x1FA00, 0x1FA6F),  # Chess Symbols
-            (0x1FA70, 0x1FAFF),  # Symbols and Pictographs Extended-A
-            (0x231A, 0x23FF),    # Miscellaneous Technical
-            (0x2B50, 0x2B55),    # Stars
-            (0x203C, 0x3299),    # Miscellaneous Symbols
-        ]
-
-        for char in text:
-            code = ord(char)
-            if any(start <= code <= end for start, end in emoji_ranges):
-                return True
-        return False
+        return contains_emoji(text)
 
     def _generate_emoji(self, description: str, name: str) -> str:
         """Generate emoji based on semantic analysis."""
-        text = f"{description} {name}".lower()
+        return classify(f"{description} {name}")
 
-        # Look for matching patterns
-        for pattern, emoji in EMOJI_FIXES.items():
-            if pattern in text:
-                return emoji
-
-        return DEFAULT_EMOJI
-
-    def fix_group(self, prompt: Dict[str, Any]) -> bool:
+    def fix_group(self, prompt: Dict[str, Any], pid: Optional[str] = None) -> bool:
         """
         Fix group field - ensure array with at least one element.
 
@@ -284,29 +255,30 @@ class PromptFixer:
             True if a fix was applied.
         """
         group = prompt.get("group")
-        pid = prompt.get("id", "unknown")
+        if pid is None:
+            pid = prompt.get("id", "unknown")
 
         # Missing group
         if group is None:
-            prompt["group"] = ["General"]
+            prompt["group"] = [DEFAULT_GROUP]
             self.add_fix(pid, "group", "Added default: ['General']")
             return True
 
         # String instead of array
         if isinstance(group, str):
-            prompt["group"] = [group]
+            prompt["group"] = [sys.intern(group)]
             self.add_fix(pid, "group", f"Converted string to array: ['{group}']")
             return True
 
         # Not an array
         if not isinstance(group, list):
-            prompt["group"] = ["General"]
+            prompt["group"] = [DEFAULT_GROUP]
             self.add_fix(pid, "group", f"Converted {type(group).__name__} to array: ['General']")
             return True
 
         # Empty array
         if len(group) == 0:
-            prompt["group"] = ["General"]
+            prompt["group"] = [DEFAULT_GROUP]
             self.add_fix(pid, "group", "Added default to empty array: ['General']")
             return True
 
@@ -314,12 +286,12 @@ class PromptFixer:
         fixed_group = []
         for g in group:
             if isinstance(g, str) and g.strip():
-                fixed_group.append(g.strip())
+                fixed_group.append(sys.intern(g.strip()))
             elif g is not None:
                 self.add_warning(pid, "group", f"Removed invalid entry: {g}")
 
         if len(fixed_group) == 0:
-            prompt["group"] = ["General"]
+            prompt["group"] = [DEFAULT_GROUP]
             self.add_fix(pid, "group", "Replaced invalid array with: ['General']")
             return True
 
@@ -330,7 +302,7 @@ class PromptFixer:
 
         return False
 
-    def fix_description(self, prompt: Dict[str, Any]) -> bool:
+    def fix_description(self, prompt: Dict[str, Any], pid: Optional[str] = None) -> bool:
         """
         Fix description field - ensure string type.
 
@@ -338,7 +310,8 @@ class PromptFixer:
             True if a fix was applied.
         """
         description = prompt.get("description")
-        pid = prompt.get("id", "unknown")
+        if pid is None:
+            pid = prompt.get("id", "unknown")
 
         if description is None:
             prompt["description"] = ""
@@ -352,7 +325,7 @@ class PromptFixer:
 
         return False
 
-    def fix_prompt(self, prompt: Dict[str, Any]) -> bool:
+    def fix_prompt(self, prompt: Dict[str, Any], pid: Optional[str] = None) -> bool:
         """
         Fix prompt content field - ensure non-empty string with YAML frontmatter.
 
@@ -360,10 +333,11 @@ class PromptFixer:
             True if a fix was applied.
         """
         prompt_content = prompt.get("prompt", "")
-        pid = prompt.get("id", "unknown")
+        if pid is None:
+            pid = prompt.get("id", "unknown")
         name = prompt.get("name", "")
         description = prompt.get("description", "")
-        group = prompt.get("group", ["General"])
+        group = prompt.get("group", [DEFAULT_GROUP])
 
         # Empty prompt
         if not prompt_content:
@@ -392,14 +366,32 @@ class PromptFixer:
         self, name: str, description: str, group: List[str]
     ) -> str:
         """Generate minimal YAML frontmatter."""
-        category = group[0] if group else "General"
-        return (
-            "---\n"
-            f"description: {description}\n"
-            f"category:\n"
-            f"  - {category}\n"
-            "---"
-        )
+        category = group[0] if group else DEFAULT_GROUP
+        return _minimal_frontmatter(description, category)
+
+    def _is_already_valid(self, prompt: Dict[str, Any], index: int) -> bool:
+        """Cheap check that none of the fix_* methods would change the prompt."""
+        if prompt.get("id") != str(index + 1):
+            return False
+
+        name = prompt.get("name")
+        if not name or not isinstance(name, str):
+            return False
+
+        if not isinstance(prompt.get("description"), str):
+            return False
+
+        if not self._is_valid_emoji(prompt.get("emoji")):
+            return False
+
+        group = prompt.get("group")
+        if not isinstance(group, list) or not group:
+            return False
+        if not all(isinstance(g, str) and g.strip() for g in group):
+            return False
+
+        prompt_content = prompt.get("prompt")
+        return isinstance(prompt_content, str) and prompt_content.strip().startswith("---")
 
     def fix_prompt_object(self, prompt: Dict[str, Any], index: int) -> bool:
         """
@@ -408,14 +400,21 @@ class PromptFixer:
         Returns:
             True if any fixes were applied.
         """
+        # Fast path for prompts that are already valid (the common case on re-runs)
+        if self._is_already_valid(prompt, index):
+            return False
+
         fixes = 0
 
         fixes += 1 if self.fix_id(prompt, index) else 0
-        fixes += 1 if self.fix_name(prompt) else 0
-        fixes += 1 if self.fix_description(prompt) else 0
-        fixes += 1 if self.fix_emoji(prompt) else 0
-        fixes += 1 if self.fix_group(prompt) else 0
-        fixes += 1 if self.fix_prompt(prompt) else 0
+
+        # fix_id guarantees the ID, so look it up once for the other fixers
+        pid = prompt["id"]
+        fixes += 1 if self.fix_name(prompt, pid) else 0
+        fixes += 1 if self.fix_description(prompt, pid) else 0
+        fixes += 1 if self.fix_emoji(prompt, pid) else 0
+        fixes += 1 if self.fix_group(prompt, pid) else 0
+        fixes += 1 if self.fix_prompt(prompt, pid) else 0
 
         return fixes > 0
 
@@ -431,8 +430,8 @@ class PromptFixer:
 
         # Read JSON file
         try:
-            content = json_file.read_text(encoding="utf-8")
-            prompts = json.loads(content)
+            raw = json_file.read_bytes()
+            prompts = load_json_bytes(raw)
         except FileNotFoundError:
             print_color(f"Error: File not found: {json_file}", "red")
             return False
@@ -457,10 +456,10 @@ class PromptFixer:
 
         # Write output
         if not self.dry_run:
-            output_file.write_text(
-                json.dumps(prompts, ensure_ascii=False, indent=2),
-                encoding="utf-8"
-            )
+            # orjson writes NaN/Infinity as null; keep such files on the
+            # stdlib encoder (a false positive inside a string only costs speed)
+            use_orjson = b"NaN" not in raw and b"Infinity" not in raw
+            output_file.write_bytes(dump_json_bytes(prompts, use_orjson))
         else:
             print_color("Dry run mode - changes not written", "yellow")
 
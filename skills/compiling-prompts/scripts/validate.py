@@ -11,59 +11,387 @@ Usage:
 
 Requirements:
     - Python 3.6+ (standard library only, no external dependencies)
+    - Optional: orjson, used for faster JSON parsing when installed
 """
 
 import argparse
+import codecs
+import io
 import json
 import re
 import sys
+from functools import lru_cache
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Dict, Iterable, Iterator, List, Match, Optional, Set, TextIO, Tuple
+
+try:
+    import orjson  # Optional: faster JSON decoding
+except ImportError:
+    orjson = None
+
+from _emoji import contains_emoji
+
+
+_FRONTMATTER_RE = re.compile(r"^---\s*\n(.*?)\n---", re.DOTALL)
+_LEADING_WHITESPACE_RE = re.compile(r"\s*")
+
+
+def _match_frontmatter(text: str) -> Optional[Match[str]]:
+    """
+    _FRONTMATTER_RE.match(text), in linear time.
+
+    Without a closing "\n---" the regex retries the lazy body scan once per
+    newline after the opening "---", which is quadratic on bodies starting
+    with many blank lines. When a closing line exists the first or second
+    attempt succeeds, so checking for one first keeps the match linear.
+    """
+    if not text.startswith("---") or text.find("\n---", 3) == -1:
+        return None
+    return _FRONTMATTER_RE.match(text)
+
+
+def _starts_with_frontmatter(text: str) -> bool:
+    """Same as text.strip().startswith("---"), without copying text."""
+    return text.startswith("---", _LEADING_WHITESPACE_RE.match(text).end())
+
+
+# ANSI color codes
+ANSI_COLORS = {
+    "red": "\033[91m",
+    "green": "\033[92m",
+    "yellow": "\033[93m",
+    "blue": "\033[94m",
+    "magenta": "\033[95m",
+    "cyan": "\033[96m",
+    "white": "\033[97m",
+    "bold": "\033[1m",
+    "reset": "\033[0m",
+}
+ANSI_RESET = ANSI_COLORS["reset"]
+
+_ansi_enabled: Optional[bool] = None
 
 
 def enable_ansi_colors() -> bool:
-    """Enable ANSI colors on Windows."""
+    """Enable ANSI colors on Windows (only does the work on the first call)."""
+    global _ansi_enabled
+    if _ansi_enabled is not None:
+        return _ansi_enabled
+
+    _ansi_enabled = True
     if sys.platform == "win32":
         try:
             import ctypes
             kernel32 = ctypes.windll.kernel32
             kernel32.SetConsoleMode(kernel32.GetStdHandle(-11), 7)
-            return True
         except Exception:
-            return False
-    return True
+            _ansi_enabled = False
+    return _ansi_enabled
 
 
-def print_color(text: str, color: str = "") -> None:
+def print_color(text: str, color: str = "", file: Optional[TextIO] = None) -> None:
     """Print colored text to terminal (works on Windows, Mac, Linux)."""
-    colors = {
-        "red": "\033[91m",
-        "green": "\033[92m",
-        "yellow": "\033[93m",
-        "blue": "\033[94m",
-        "magenta": "\033[95m",
-        "cyan": "\033[96m",
-        "white": "\033[97m",
-        "bold": "\033[1m",
-        "reset": "\033[0m",
-    }
-
-    color_code = colors.get(color, "")
-    reset_code = colors["reset"]
-    print(f"{color_code}{text}{reset_code}")
-
-
-def print_header(text: str) -> None:
+    print(f"{ANSI_COLORS.get(color, '')}{text}{ANSI_RESET}", file=file)
+
+
+def print_header(text: str, file: Optional[TextIO] = None) -> None:
     """Print section header."""
-    print()
-    print("=" * 50)
-    print(text)
-    print("=" * 50)
+    rule = "=" * 50
+    print(f"\n{rule}\n{text}\n{rule}", file=file)
+
+
+REQUIRED_FIELDS = ("id", "name", "description", "emoji", "group", "prompt")
+_REQUIRED_SET = frozenset(REQUIRED_FIELDS)
+
+# (field, expected type, requirement message, suggestion) for _check_field_types,
+# in REQUIRED_FIELDS order
+FIELD_TYPE_SPECS: Tuple[Tuple[str, type, str, str], ...] = (
+    ("id", str, "ID must be a string", "Convert ID to string format"),
+    ("name", str, "Name must be a string", "Convert name to string"),
+    ("description", str, "Description must be a string", "Convert description to string"),
+    ("emoji", str, "Emoji must be a string", "Use a string for emoji"),
+    ("group", list, "Group must be an array", "Use array format: ['Category1', 'Category2']"),
+    ("prompt", str, "Prompt must be a string", "Convert prompt content to string"),
+)
+
+# Emoji suggestions for --verbose, in priority order, with the description
+# keywords that trigger them
+EMOJI_SUGGESTIONS = {
+    "👨‍💼": ["pm", "product manager", "business", "strategy"],
+    "👨‍💻": ["developer", "engineer", "coding", "programming", "software"],
+    "✍️": ["writer", "writing", "copy", "content"],
+    "🎨": ["design", "creative", "art", "ui", "ux"],
+    "📊": ["analytic", "data", "metric", "analysis"],
+    "🤖": ["assistant", "helper", "copilot", "ai"],
+    "💬": ["chat", "support", "communication"],
+    "📚": ["teacher", "education", "learning"],
+    "💰": ["finance", "money", "trading"],
+    "🔬": ["science", "research", "lab"],
+}
+
+# Each emoji's keywords precompiled into one alternation, in priority order
+_SUGGESTION_PATTERNS = tuple(
+    (emoji, re.compile("|".join(re.escape(kw) for kw in kws)))
+    for emoji, kws in EMOJI_SUGGESTIONS.items()
+)
+# Descriptions shorter than this cannot contain any keyword
+_MIN_SUGGESTION_KEYWORD_LEN = min(len(kw) for kws in EMOJI_SUGGESTIONS.values() for kw in kws)
+
+
+@lru_cache(maxsize=1024)
+def _cached_suggest(desc: str, current: str) -> Optional[str]:
+    """
+    First EMOJI_SUGGESTIONS emoji other than current whose keyword appears
+    in desc (cached on the raw description, so repeated descriptions skip
+    the lowercasing as well as the keyword search).
+    """
+    desc_lower = desc.lower()
+    for emoji, pattern in _SUGGESTION_PATTERNS:
+        if emoji != current and pattern.search(desc_lower):
+            return emoji
+    return None
+
+
+# Marks a field that is absent from a prompt object
+_MISSING = object()
+
+
+def _field_values(prompt: Dict[str, Any]) -> List[Any]:
+    """Values of REQUIRED_FIELDS in prompt, in order (_MISSING where absent)."""
+    return [prompt.get(field, _MISSING) for field in REQUIRED_FIELDS]
+
+
+class RootNotArrayError(ValueError):
+    """Raised when a JSON document's root element is not an array."""
+
+
+_JSON_WHITESPACE_RE = re.compile(r"[ \t\n\r]*")
+_JSON_NUMBER_TAIL_RE = re.compile(r"[0-9.eE+-]*")
+
+
+def _json_error(
+    msg: str, buf: str, pos: int, lines_before: int, column_before: int, chars_before: int
+) -> json.JSONDecodeError:
+    """
+    Build a JSONDecodeError whose position is relative to the whole file, not buf.
+
+    lines_before and chars_before count the newlines and characters already
+    dropped from the front of buf; column_before is how much of buf's first
+    line was dropped.
+    """
+    err = json.JSONDecodeError(msg, buf, pos)
+    if err.lineno == 1:
+        err.colno += column_before
+    err.lineno += lines_before
+    err.pos += chars_before
+    err.args = (f"{msg}: line {err.lineno} column {err.colno} (char {err.pos})",)
+    return err
+
+
+def iter_json_array(json_file: Path, chunk_size: int = 1 << 16) -> Iterator[Any]:
+    """
+    Yield the elements of a JSON file's top-level array one at a time.
+
+    The file is decoded incrementally and each element is parsed with
+    json.JSONDecoder.raw_decode as soon as it is complete, so the whole
+    document is never held in memory at once.
+
+    Raises:
+        RootNotArrayError: If the root element is not an array.
+        json.JSONDecodeError: If the JSON is malformed.
+    """
+    decoder = json.JSONDecoder()
+    utf8 = codecs.getincrementaldecoder("utf-8-sig")()
+    buf = ""
+    pos = 0
+    eof = False
+    # Text already dropped from the front of buf: newlines, characters, and
+    # characters of the line buf now starts in
+    lines_before = 0
+    column_before = 0
+    chars_before = 0
+
+    with open(json_file, "rb") as f:
+
+        def read_more(size: int) -> None:
+            nonlocal buf, eof
+            chunk = f.read(size)
+            if chunk:
+                buf += utf8.decode(chunk)
+            else:
+                buf += utf8.decode(b"", final=True)
+                eof = True
+
+        def skip_whitespace() -> str:
+            """Advance pos past whitespace and return the next character ('' at EOF)."""
+            nonlocal pos
+            while True:
+                pos = _JSON_WHITESPACE_RE.match(buf, pos).end()
+                if pos < len(buf) or eof:
+                    return buf[pos:pos + 1]
+                read_more(chunk_size)
+
+        def error(msg: str, at: Optional[int] = None) -> json.JSONDecodeError:
+            return _json_error(
+                msg, buf, pos if at is None else at, lines_before, column_before, chars_before
+            )
+
+        char = skip_whitespace()
+        if char != "[":
+            # Not an array: parse the whole document so invalid JSON is
+            # still reported as such
+            while not eof:
+                read_more(chunk_size)
+            try:
+                _, end = decoder.raw_decode(buf, pos)
+            except json.JSONDecodeError as e:
+                raise error(e.msg, e.pos) from None
+            pos = end
+            if skip_whitespace():
+                raise error("Extra data")
+            raise RootNotArrayError("Root element must be an array")
+        pos += 1
+
+        first = True
+        while True:
+            char = skip_whitespace()
+            if char == "]" and first:
+                pos += 1
+                break
+            if not char:
+                raise error("Expecting value")
+            first = False
+
+            # Parse one element, reading more text until it is complete. A
+            # value followed only by number characters up to the end of buf
+            # (e.g. "1" of "1.5e3") may continue in the next chunk.
+            while True:
+                try:
+                    value, end = decoder.raw_decode(buf, pos)
+                except json.JSONDecodeError as e:
+                    if eof:
+                        raise error(e.msg, e.pos) from None
+                    value, end = None, -1
+                if end != -1 and (eof or _JSON_NUMBER_TAIL_RE.match(buf, end).end() < len(buf)):
+                    break
+                read_more(max(chunk_size, len(buf) - pos))
+            pos = end
+            yield value
+
+            # Drop the consumed text so memory stays bounded. Only the dropped
+            # part is scanned for newlines, so each character is scanned once
+            # however long the lines are (minified files are one line).
+            if pos > chunk_size:
+                newlines = buf.count("\n", 0, pos)
+                if newlines:
+                    lines_before += newlines
+                    column_before = pos - buf.rfind("\n", 0, pos) - 1
+                else:
+                    column_before += pos
+                chars_before += pos
+                buf = buf[pos:]
+                pos = 0
+
+            char = skip_whitespace()
+            if char == ",":
+                pos += 1
+            elif char == "]":
+                pos += 1
+                break
+            else:
+                raise error("Expecting ',' delimiter")
+
+        if skip_whitespace():
+            raise error("Extra data")
+
+
+def load_prompts(json_file: Path) -> Iterable[Any]:
+    """
+    Load the top-level prompts array of a JSON file.
+
+    With orjson installed the file is parsed in one go straight from bytes;
+    otherwise it is streamed element by element with iter_json_array.
+
+    orjson is stricter than the stdlib parser (no NaN/Infinity, no lone
+    surrogates) and turns integers beyond 64 bits into floats. When it
+    rejects a file, or a prompt field holds such a float, the file is
+    re-read with iter_json_array so the report never depends on whether
+    orjson is installed.
+
+    Raises:
+        RootNotArrayError: If the root element is not an array.
+        json.JSONDecodeError: If the JSON is malformed.
+    """
+    if orjson is None:
+        return iter_json_array(json_file)
+
+    data = json_file.read_bytes()
+    if data.startswith(codecs.BOM_UTF8):
+        data = memoryview(data)[len(codecs.BOM_UTF8):]
+    try:
+        prompts = orjson.loads(data)
+    except orjson.JSONDecodeError:
+        return iter_json_array(json_file)
+
+    if not isinstance(prompts, list):
+        raise RootNotArrayError("Root element must be an array")
+    if _has_big_float_fields(prompts):
+        return iter_json_array(json_file)
+    return prompts
+
+
+# Floats this large in a prompt field may be integers orjson could not keep
+_BIG_FLOAT = float(1 << 63)
+
+
+def _has_big_float_fields(prompts: List[Any]) -> bool:
+    """Whether any prompt field (or group entry) is a float of at least 2**63 in magnitude."""
+    for prompt in prompts:
+        if not isinstance(prompt, dict):
+            continue
+        for field in REQUIRED_FIELDS:
+            value = prompt.get(field)
+            values = value if isinstance(value, list) else (value,)
+            for item in values:
+                if type(item) is float and abs(item) >= _BIG_FLOAT:
+                    return True
+    return False
+
+
+class _SeenIds:
+    """
+    The prompt IDs seen so far, for duplicate detection.
+
+    Well-formed files number prompts "1", "2", "3"... in order. While that
+    holds only a counter is kept; the actual set is built the first time an
+    ID breaks the run.
+    """
+
+    __slots__ = ("run", "ids")
+
+    def __init__(self) -> None:
+        self.run = 0  # IDs seen so far are exactly "1".."run", in that order
+        self.ids: Optional[Set[Any]] = None
+
+    def add(self, pid: Any) -> bool:
+        """Record pid; return True if it had already been seen."""
+        if self.ids is None:
+            if pid == str(self.run + 1):
+                self.run += 1
+                return False
+            self.ids = {str(i) for i in range(1, self.run + 1)}
+
+        if pid in self.ids:
+            return True
+        self.ids.add(pid)
+        return False
 
 
 class ValidationIssue:
     """Represents a single validation issue."""
 
+    __slots__ = ("level", "prompt_id", "field", "message", "suggestion")
+
     def __init__(
         self,
         level: str,
@@ -85,7 +413,10 @@ class PromptValidator:
     def __init__(self, verbose: bool = False):
         self.verbose = verbose
         self.issues: List[ValidationIssue] = []
-        self.prompts: List[Dict[str, Any]] = []
+        # Same issues as self.issues, already split by level for the report
+        self._by_level: Dict[str, List[ValidationIssue]] = {"error": [], "warning": [], "info": []}
+        # Issue counts per level, including issues that were not kept
+        self._counts: Dict[str, int] = {"error": 0, "warning": 0, "info": 0}
 
     def add_issue(
         self,
@@ -94,358 +425,300 @@ class PromptValidator:
         field: str,
         message: str,
         suggestion: Optional[str] = None,
+        message_args: Tuple[Any, ...] = (),
     ) -> None:
-        """Add a validation issue."""
-        self.issues.append(ValidationIssue(level, prompt_id, field, message, suggestion))
-
-    def check_required_fields(self) -> None:
-        """Check that all required fields are present."""
-        required_fields = ["id", "name", "description", "emoji", "group", "prompt"]
-
-        for prompt in self.prompts:
-            pid = prompt.get("id", "unknown")
-            name = prompt.get("name", "unknown")
-
-            for field in required_fields:
-                if field not in prompt:
-                    self.add_issue(
-                        "error",
-                        str(pid),
-                        field,
-                        f"Required field '{field}' is missing",
-                        f"Add '{field}': <value> to the prompt object"
-                    )
-
-    def check_field_types(self) -> None:
-        """Check that fields have correct types."""
-        for prompt in self.prompts:
-            pid = prompt.get("id", "unknown")
-
-            # Check id is string
-            if "id" in prompt and not isinstance(prompt["id"], str):
-                self.add_issue(
-                    "error",
-                    str(pid),
-                    "id",
-                    f"ID must be a string, got {type(prompt['id']).__name__}",
-                    "Convert ID to string format"
-                )
-
-            # Check name is string
-            if "name" in prompt and not isinstance(prompt["name"], str):
-                self.add_issue(
-                    "error",
-                    str(pid),
-                    "name",
-                    f"Name must be a string, got {type(prompt['name']).__name__}",
-                    "Convert name to string"
-                )
-
-            # Check description is string
-            if "description" in prompt and not isinstance(prompt["description"], str):
-                self.add_issue(
-                    "error",
-                    str(pid),
-                    "description",
-                    f"Description must be a string, got {type(prompt['description']).__name__}",
-                    "Convert description to string"
-                )
-
-            # Check emoji is string
-            if "emoji" in prompt and not isinstance(prompt["emoji"], str):
-                self.add_issue(
-                    "error",
-                    str(pid),
-                    "emoji",
-                    f"Emoji must be a string, got {type(prompt['emoji']).__name__}",
-                    "Use a string for emoji"
-                )
-
-            # Check group is array
-            if "group" in prompt and not isinstance(prompt["group"], list):
-                self.add_issue(
-                    "error",
-                    str(pid),
-                    "group",
-                    f"Group must be an array, got {type(prompt['group']).__name__}",
-                    "Use array format: ['Category1', 'Category2']"
-                )
-
-            # Check prompt is string
-            if "prompt" in prompt and not isinstance(prompt["prompt"], str):
-                self.add_issue(
-                    "error",
-                    str(pid),
-                    "prompt",
-                    f"Prompt must be a string, got {type(prompt['prompt']).__name__}",
-                    "Convert prompt content to string"
-                )
-
-    def check_id_sequence(self) -> None:
-        """Check that IDs are sequential starting from '1'."""
-        id_set = set()
-
-        for i, prompt in enumerate(self.prompts, 1):
-            pid = prompt.get("id")
-
-            if pid is None:
-                continue
+        """
+        Add a validation issue.
 
-            # Check if ID is numeric string
-            if isinstance(pid, str) and not pid.isdigit():
+        Warnings and infos are only counted unless verbose, since the report
+        never shows them otherwise. With message_args, message is a
+        str.format template that is only filled in if the issue is kept.
+        """
+        self._counts[level] += 1
+        if level != "error" and not self.verbose:
+            return
+
+        if message_args:
+            message = message.format(*message_args)
+        issue = ValidationIssue(level, prompt_id, field, message, suggestion)
+        self.issues.append(issue)
+        self._by_level[level].append(issue)
+
+    def _check_required_fields(self, prompt: Dict[str, Any], pid: Any) -> None:
+        """Check required fields of one prompt."""
+        # One C-level set difference against the dict's keys; usually empty
+        missing = _REQUIRED_SET.difference(prompt)
+        if not missing:
+            return
+
+        for field in REQUIRED_FIELDS:
+            if field in missing:
                 self.add_issue(
                     "error",
                     str(pid),
-                    "id",
-                    f"ID must be numeric string, got '{pid}'",
-                    "Use numeric values like '1', '2', '3'..."
+                    field,
+                    f"Required field '{field}' is missing",
+                    f"Add '{field}': <value> to the prompt object"
                 )
-                continue
 
-            # Check for duplicates
-            if pid in id_set:
+    def _check_field_types(self, values: List[Any], pid: Any) -> None:
+        """Check field types of one prompt, given its _field_values."""
+        for (field, expected_type, requirement, suggestion), value in zip(FIELD_TYPE_SPECS, values):
+            if value is not _MISSING and not isinstance(value, expected_type):
                 self.add_issue(
                     "error",
                     str(pid),
-                    "id",
-                    f"Duplicate ID found: '{pid}'",
-                    "Assign unique sequential IDs"
-                )
-            id_set.add(pid)
-
-            # Check if sequential
-            expected_id = str(i)
-            if isinstance(pid, str) and pid != expected_id:
-                self.add_issue(
-                    "warning",
-                    str(pid),
-                    "id",
-                    f"ID is not sequential: expected '{expected_id}', got '{pid}'",
-                    "Use sequential IDs starting from '1'"
-                )
-
-    def check_emoji_validity(self) -> None:
-        """Check emoji validity and suggest improvements."""
-        for prompt in self.prompts:
-            emoji = prompt.get("emoji", "")
-            pid = prompt.get("id", "unknown")
-            desc = prompt.get("description", "")
-
-            # Check emoji length
-            if not emoji:
-                self.add_issue(
-                    "error",
-                    pid,
-                    "emoji",
-                    "Emoji is missing",
-                    "Add a relevant emoji based on description"
+                    field,
+                    f"{requirement}, got {type(value).__name__}",
+                    suggestion
                 )
-                continue
 
-            # Check if it looks like an emoji
-            if not self._looks_like_emoji(emoji):
+    def _check_id(self, pid: Any, position: int, seen_ids: _SeenIds) -> None:
+        """Check one ID; seen_ids collects the IDs seen so far to detect duplicates."""
+        if pid is None:
+            return
+
+        # Check if ID is numeric string
+        if isinstance(pid, str) and not pid.isdigit():
+            self.add_issue(
+                "error",
+                str(pid),
+                "id",
+                f"ID must be numeric string, got '{pid}'",
+                "Use numeric values like '1', '2', '3'..."
+            )
+            return
+
+        # Check for duplicates
+        if seen_ids.add(pid):
+            self.add_issue(
+                "error",
+                str(pid),
+                "id",
+                f"Duplicate ID found: '{pid}'",
+                "Assign unique sequential IDs"
+            )
+
+        # Check if sequential
+        expected_id = str(position)
+        if isinstance(pid, str) and pid != expected_id:
+            self.add_issue(
+                "warning",
+                str(pid),
+                "id",
+                "ID is not sequential: expected '{}', got '{}'",
+                "Use sequential IDs starting from '1'",
+                message_args=(expected_id, pid),
+            )
+
+    def _check_emoji(self, emoji: Any, desc: Any, pid: Any) -> None:
+        """Check the emoji of one prompt."""
+        # Check emoji length
+        if not emoji:
+            self.add_issue(
+                "error",
+                pid,
+                "emoji",
+                "Emoji is missing",
+                "Add a relevant emoji based on description"
+            )
+            return
+
+        # Check if it looks like an emoji
+        if not self._looks_like_emoji(emoji):
+            self.add_issue(
+                "warning",
+                pid,
+                "emoji",
+                "'{}' may not be a valid emoji",
+                "Use a single emoji character",
+                message_args=(emoji,),
+            )
+
+        # Check for semantic mismatch
+        if self.verbose and desc and len(desc) >= _MIN_SUGGESTION_KEYWORD_LEN:
+            suggested = self._suggest_better_emoji(desc, emoji)
+            if suggested and suggested != emoji:
                 self.add_issue(
-                    "warning",
+                    "info",
                     pid,
                     "emoji",
-                    f"'{emoji}' may not be a valid emoji",
-                    "Use a single emoji character"
+                    f"Current: {emoji}",
+                    f"Consider: {suggested}"
                 )
 
-            # Check for semantic mismatch
-            if self.verbose and desc:
-                suggested = self._suggest_better_emoji(desc, emoji)
-                if suggested and suggested != emoji:
-                    self.add_issue(
-                        "info",
-                        pid,
-                        "emoji",
-                        f"Current: {emoji}",
-                        f"Consider: {suggested}"
-                    )
-
     def _looks_like_emoji(self, text: str) -> bool:
         """Check if text looks like an emoji."""
-        emoji_ranges = [
-            (0x1F600, 0x1F64F),  # Emoticons
-            (0x1F300, 0x1F5FF),  # Misc Symbols and Pictographs
-            (0x1F680, 0x1F6FF),  # Transport and Map
-            (0x1F1E0, 0x1F1FF),  # Flags
-            (0x2600, 0x26FF),    # Misc symbols
-            (0x2700, 0x27BF),    # Dingbats
-            (0x1F900, 0x1F9FF),  # Supplemental Symbols and Pictographs
-            (0x1FA00, 0x1FA6F),  # Chess Symbols
-            (0x1FA70, 0x1FAFF),  # Symbols and Pictographs Extended-A
-            (0x231A, 0x23FF),    # Miscellaneous Technical
-            (0x2B50, 0x2B55),    # Stars
-            (0x203C, 0x3299),    # Miscellaneous Symbols
-        ]
-
-        for char in text:
-            code = ord(char)
-            if any(start <= code <= end for start, end in emoji_ranges):
-                return True
-        return False
+        return isinstance(text, str) and contains_emoji(text)
 
     def _suggest_better_emoji(self, desc: str, current: str) -> Optional[str]:
         """Suggest a better emoji based on description."""
-        desc_lower = desc.lower()
-
-        emoji_suggestions = {
-            "👨‍💼": ["pm", "product manager", "business", "strategy"],
-            "👨‍💻": ["developer", "engineer", "coding", "programming", "software"],
-            "✍️": ["writer", "writing", "copy", "content"],
-            "🎨": ["design", "creative", "art", "ui", "ux"],
-            "📊": ["analytic", "data", "metric", "analysis"],
-            "🤖": ["assistant", "helper", "copilot", "ai"],
-            "💬": ["chat", "support", "communication"],
-            "📚": ["teacher", "education", "learning"],
-            "💰": ["finance", "money", "trading"],
-            "🔬": ["science", "research", "lab"],
-        }
-
-        for emoji, keywords in emoji_suggestions.items():
-            if emoji != current and any(kw in desc_lower for kw in keywords):
-                return emoji
-
-        return None
-
-    def check_group_format(self) -> None:
-        """Check that group field is an array with at least one element."""
-        for prompt in self.prompts:
-            group = prompt.get("group")
-            pid = prompt.get("id", "unknown")
-
-            if group is None:
-                continue
-
-            if isinstance(group, str):
+        # A non-string emoji never equals a suggestion; "" behaves the same
+        # and keeps the cache key hashable
+        return _cached_suggest(desc, current if isinstance(current, str) else "")
+
+    def _check_group(self, group: Any, pid: Any) -> None:
+        """Check the group field of one prompt."""
+        if group is None:
+            return
+
+        if isinstance(group, str):
+            self.add_issue(
+                "error",
+                pid,
+                "group",
+                f"Group is a string, should be array. Got: '{group}'",
+                f"Change to 'group': ['{group}']"
+            )
+            return
+
+        if isinstance(group, list):
+            if len(group) == 0:
                 self.add_issue(
                     "error",
                     pid,
                     "group",
-                    f"Group is a string, should be array. Got: '{group}'",
-                    f"Change to 'group': ['{group}']"
+                    "Group array is empty",
+                    "Add at least one category: ['General']"
                 )
-                continue
 
-            if isinstance(group, list):
-                if len(group) == 0:
+            # Check for empty strings in group
+            for i, g in enumerate(group):
+                if not isinstance(g, str):
                     self.add_issue(
-                        "error",
+                        "warning",
                         pid,
                         "group",
-                        "Group array is empty",
-                        "Add at least one category: ['General']"
+                        "group[{}] is not a string: {}",
+                        "Use string values for group categories",
+                        message_args=(i, g),
+                    )
+                elif not g.strip():
+                    self.add_issue(
+                        "warning",
+                        pid,
+                        "group",
+                        "group[{}] is an empty string",
+                        "Remove empty group entries",
+                        message_args=(i,),
                     )
 
-                # Check for empty strings in group
-                for i, g in enumerate(group):
-                    if not isinstance(g, str):
-                        self.add_issue(
-                            "warning",
-                            pid,
-                            "group",
-                            f"group[{i}] is not a string: {g}",
-                            "Use string values for group categories"
-                        )
-                    elif not g.strip():
-                        self.add_issue(
-                            "warning",
-                            pid,
-                            "group",
-                            f"group[{i}] is an empty string",
-                            "Remove empty group entries"
-                        )
-
-    def check_prompt_content(self) -> None:
-        """Check prompt content validity."""
-        for prompt in self.prompts:
-            prompt_content = prompt.get("prompt", "")
-            pid = prompt.get("id", "unknown")
-
-            if not prompt_content:
+    def _check_prompt_content(self, prompt_content: Any, pid: Any) -> None:
+        """Check the prompt content of one prompt."""
+        if not prompt_content:
+            self.add_issue(
+                "error",
+                pid,
+                "prompt",
+                "Prompt content is empty",
+                "Add the actual prompt content including YAML frontmatter"
+            )
+            return
+
+        # Check for YAML frontmatter
+        if not _starts_with_frontmatter(prompt_content):
+            self.add_issue(
+                "warning",
+                pid,
+                "prompt",
+                "Prompt may be missing YAML frontmatter",
+                "Add YAML frontmatter starting with '---'"
+            )
+
+        # Check for common YAML frontmatter fields
+        frontmatter_match = _match_frontmatter(prompt_content)
+        if frontmatter_match:
+            yaml_text = frontmatter_match.group(1)
+
+            if "description:" not in yaml_text:
                 self.add_issue(
-                    "error",
+                    "info",
                     pid,
                     "prompt",
-                    "Prompt content is empty",
-                    "Add the actual prompt content including YAML frontmatter"
+                    "YAML frontmatter missing 'description' field",
+                    "Add 'description: <brief description>'"
                 )
-                continue
 
-            # Check for YAML frontmatter
-            if not prompt_content.strip().startswith("---"):
+            if "category:" not in yaml_text and "group:" not in yaml_text:
                 self.add_issue(
-                    "warning",
+                    "info",
                     pid,
                     "prompt",
-                    "Prompt may be missing YAML frontmatter",
-                    "Add YAML frontmatter starting with '---'"
+                    "YAML frontmatter missing 'category' field",
+                    "Add 'category: [CategoryName]'"
                 )
 
-            # Check for common YAML frontmatter fields
-            if "---" in prompt_content:
-                frontmatter_match = re.match(
-                    r"^---\s*\n(.*?)\n---",
-                    prompt_content,
-                    re.DOTALL
-                )
-                if frontmatter_match:
-                    yaml_text = frontmatter_match.group(1)
-
-                    if "description:" not in yaml_text:
-                        self.add_issue(
-                            "info",
-                            pid,
-                            "prompt",
-                            "YAML frontmatter missing 'description' field",
-                            "Add 'description: <brief description>'"
-                        )
-
-                    if "category:" not in yaml_text and "group:" not in yaml_text:
-                        self.add_issue(
-                            "info",
-                            pid,
-                            "prompt",
-                            "YAML frontmatter missing 'category' field",
-                            "Add 'category: [CategoryName]'"
-                        )
+    def _validate_prompt(self, prompt: Dict[str, Any], position: int, seen_ids: _SeenIds) -> None:
+        """Run every check against one prompt object."""
+        # Look each field up once and hand the values to the checks
+        values = _field_values(prompt)
+        pid, _, desc, emoji, group, prompt_content = values
+        has_id = pid is not _MISSING
+        if not has_id:
+            pid = "unknown"
+
+        self._check_required_fields(prompt, pid)
+        self._check_field_types(values, pid)
+        if has_id:
+            self._check_id(pid, position, seen_ids)
+        self._check_emoji("" if emoji is _MISSING else emoji, "" if desc is _MISSING else desc, pid)
+        self._check_group(None if group is _MISSING else group, pid)
+        self._check_prompt_content("" if prompt_content is _MISSING else prompt_content, pid)
+
+    def _issue_checkpoint(self) -> Tuple[int, Dict[str, int], Dict[str, int]]:
+        """Snapshot of how many issues have been recorded so far."""
+        by_level = {level: len(issues) for level, issues in self._by_level.items()}
+        return len(self.issues), by_level, dict(self._counts)
+
+    def _discard_issues_since(self, checkpoint: Tuple[int, Dict[str, int], Dict[str, int]]) -> None:
+        """
+        Drop every issue recorded after checkpoint.
+
+        Prompts are validated while the file is still being parsed, so a file
+        that turns out to be malformed may already have produced issues. They
+        are discarded so the result matches parsing the whole file up front:
+        invalid JSON is reported on its own, whatever parser is used.
+        """
+        issue_count, by_level, counts = checkpoint
+        del self.issues[issue_count:]
+        for level, issues in self._by_level.items():
+            del issues[by_level[level]:]
+        self._counts.update(counts)
 
     def validate_file(self, json_file: Path) -> bool:
         """
         Validate a JSON file against CherryStudio schema.
 
+        Prompts come from load_prompts (orjson when installed, otherwise
+        streamed from the file) and are checked one by one; they are not
+        kept after validation.
+
         Returns:
             True if validation passes (no errors), False otherwise.
         """
-        # Read and parse JSON
+        seen_ids = _SeenIds()
+        count = 0
+        # Issues found before a parse error are dropped (see _discard_issues_since)
+        checkpoint = self._issue_checkpoint()
+
+        # Parse and validate
         try:
-            content = json_file.read_text(encoding="utf-8")
-            self.prompts = json.loads(content)
+            for count, prompt in enumerate(load_prompts(json_file), 1):
+                self._validate_prompt(prompt, count, seen_ids)
         except FileNotFoundError:
             print_color(f"Error: File not found: {json_file}", "red")
             return False
         except json.JSONDecodeError as e:
+            self._discard_issues_since(checkpoint)
             print_color(f"Error: Invalid JSON - {e}", "red")
             return False
-
-        # Check if it's an array
-        if not isinstance(self.prompts, list):
+        except RootNotArrayError:
+            self._discard_issues_since(checkpoint)
             print_color("Error: Root element must be an array", "red")
             return False
 
-        if len(self.prompts) == 0:
+        if count == 0:
             print_color("Warning: Empty array - no prompts to validate", "yellow")
-            return True
-
-        # Run all validations
-        self.check_required_fields()
-        self.check_field_types()
-        self.check_id_sequence()
-        self.check_emoji_validity()
-        self.check_group_format()
-        self.check_prompt_content()
 
         return True
 
@@ -456,38 +729,41 @@ class PromptValidator:
         Returns:
             Tuple of (error_count, warning_count, info_count)
         """
-        errors = [i for i in self.issues if i.level == "error"]
-        warnings = [i for i in self.issues if i.level == "warning"]
-        infos = [i for i in self.issues if i.level == "info"]
+        counts = self._counts
+        errors = self._by_level["error"]
+        warnings = self._by_level["warning"]
+        infos = self._by_level["info"]
 
-        print_header("Validation Summary")
-        print(f"Errors: {len(errors)}")
-        print(f"Warnings: {len(warnings)}")
-        print(f"Info: {len(infos)}")
+        # Build the whole report in memory and write it to stdout once
+        out = io.StringIO()
+        print_header("Validation Summary", file=out)
+        out.write(f"Errors: {counts['error']}\nWarnings: {counts['warning']}\nInfo: {counts['info']}\n")
 
         if errors:
-            self._print_issues("Errors", errors, "red")
+            self._print_issues("Errors", errors, "red", out)
         if warnings and self.verbose:
-            self._print_issues("Warnings", warnings, "yellow")
+            self._print_issues("Warnings", warnings, "yellow", out)
         if infos and self.verbose:
-            self._print_issues("Info", infos, "blue")
+            self._print_issues("Info", infos, "blue", out)
+
+        sys.stdout.write(out.getvalue())
+        sys.stdout.flush()
 
-        return len(errors), len(warnings), len(infos)
+        return counts["error"], counts["warning"], counts["info"]
 
-    def _print_issues(self, title: str, issues: List[ValidationIssue], color: str) -> None:
-        """Print issues."""
-        print()
-        print_color(title, color)
-        print("-" * len(title))
+    def _print_issues(self, title: str, issues: List[ValidationIssue], color: str, out: TextIO) -> None:
+        """Write issues to out."""
+        out.write("\n")
+        print_color(title, color, file=out)
+        out.write("-" * len(title) + "\n")
 
         for i in issues[:20]:  # Limit to first 20 issues
-            print(f"\n{i.prompt_id} - {i.field}")
-            print(f"  {i.message}")
+            out.write(f"\n{i.prompt_id} - {i.field}\n  {i.message}\n")
             if i.suggestion:
-                print(f"  💡 {i.suggestion}")
+                out.write(f"  💡 {i.suggestion}\n")
 
         if len(issues) > 20:
-            print(f"\n... and {len(issues) - 20} more")
+            out.write(f"\n... and {len(issues) - 20} more\n")
 
 
 def main():